@@ -3,18 +3,74 @@ Base classes and common functionality for MP4 to SVG converters
 """
 
 import os
+import gzip
+import json
+import mmap
 import struct
 import hashlib
-import base64
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, Dict, Any, BinaryIO, Iterator, TextIO, Tuple, Union
 import cv2
 import numpy as np
+from .mp4box import read_mp4_metadata
+
+# Prefer the SIMD-accelerated libbase64 bindings when the 'fast' extra is installed
+try:
+    from pybase64 import b64decode as fast_b64decode, b64encode as fast_b64encode
+except ImportError:
+    from base64 import b64decode as fast_b64decode, b64encode as fast_b64encode
+
+# orjson parses straight into Python objects; stdlib json is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Directory for persisting decoder-based metadata probes across runs (opt-in)
+PROBE_CACHE_ENV = 'MP4SVG_PROBE_CACHE'
+
+
+def _probe_cache_file(mp4_path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Path of the on-disk probe cache entry for a file, or None if disabled"""
+    cache_dir = os.environ.get(PROBE_CACHE_ENV)
+    if not cache_dir:
+        return None
+    key = hashlib.sha1(f"{os.path.abspath(mp4_path)}|{mtime_ns}|{size}".encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}.json")
+
+
+def _read_probe_cache(cache_file: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_file, 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_probe_cache(cache_file: str, metadata: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f)
+        os.replace(temp_file, cache_file)  # Atomic, so readers never see a partial entry
+    except OSError:
+        pass  # The cache is an optimisation only
 
 
 class BaseConverter(ABC):
     """Abstract base class for all MP4 to SVG converters"""
     
+    # Below this size a JPEG preview can rival the video itself, so skip it
+    MIN_VIDEO_SIZE_FOR_THUMBNAIL = 200_000
+    # gzip level for '.svgz' outputs; the encoded video barely compresses
+    # further, so the fastest level costs ~1% in size for much less CPU
+    SVGZ_COMPRESSLEVEL = 1
+    # Write buffer for SVG outputs, so small markup writes coalesce into few syscalls
+    OUTPUT_BUFFER_SIZE = 1 << 20
+    
     @abstractmethod
     def convert(self, mp4_path: str, output_path: str, **kwargs) -> str:
         """Convert MP4 to SVG using specific encoding method"""
@@ -27,37 +83,150 @@ class BaseConverter(ABC):
     
     def _get_video_metadata(self, mp4_path: str) -> Dict[str, Any]:
         """Extract metadata from video file"""
+        # Keyed on mtime and size so an overwritten file is probed again,
+        # even when the rewrite lands within the filesystem's mtime granularity
+        st = os.stat(mp4_path)
+        return dict(self._cached_video_metadata(mp4_path, st.st_mtime_ns, st.st_size))
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_video_metadata(mp4_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Probe metadata once per (path, mtime, size) across converters and calls"""
+        # Walking the MP4 box tree is far cheaper than initialising a decoder
+        metadata = read_mp4_metadata(mp4_path)
+        if metadata is not None:
+            return metadata
+        
+        # Decoder probes are slow enough to be worth persisting between runs
+        cache_file = _probe_cache_file(mp4_path, mtime_ns, size)
+        if cache_file:
+            metadata = _read_probe_cache(cache_file)
+            if metadata is not None:
+                return metadata
+        
+        cap = cv2.VideoCapture(mp4_path)
+        metadata = BaseConverter._read_capture_metadata(cap)
+        cap.release()
+        
+        if cache_file:
+            _write_probe_cache(cache_file, metadata)
+        return metadata
+    
+    def _probe_video(self, mp4_path: str) -> Tuple[Dict[str, Any], Optional[np.ndarray]]:
+        """Return video metadata and, for previewed sizes, the first frame"""
+        # Box-tree metadata first, so a file the decoder cannot open still
+        # reports its real dimensions instead of the capture's -1 defaults
+        metadata = self._get_video_metadata(mp4_path)
+        
+        # Tiny clips get no preview, so there is no frame to decode
+        if os.path.getsize(mp4_path) < self.MIN_VIDEO_SIZE_FOR_THUMBNAIL:
+            return metadata, None
+        
         cap = cv2.VideoCapture(mp4_path)
-        metadata = {
+        ret, frame = cap.read()
+        cap.release()
+        return metadata, frame if ret else None
+    
+    @staticmethod
+    def _read_capture_metadata(cap: "cv2.VideoCapture") -> Dict[str, Any]:
+        """Read metadata properties from an open VideoCapture"""
+        return {
             'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
             'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
             'fps': cap.get(cv2.CAP_PROP_FPS),
             'frame_count': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
             'duration': cap.get(cv2.CAP_PROP_FRAME_COUNT) / cap.get(cv2.CAP_PROP_FPS) if cap.get(cv2.CAP_PROP_FPS) > 0 else 0
         }
-        cap.release()
-        return metadata
     
-    def _create_thumbnail(self, mp4_path: str, max_height: int = 120) -> Tuple[str, int, int]:
-        """Create Base64 encoded thumbnail from first frame"""
-        cap = cv2.VideoCapture(mp4_path)
-        ret, frame = cap.read()
+    def _encode_thumbnail(self, frame: Optional[np.ndarray], max_height: int = 120) -> Tuple[str, int, int]:
+        """Create Base64 encoded JPEG thumbnail from an already decoded frame"""
         thumbnail_b64 = ""
         thumb_width = thumb_height = 0
         
-        if ret:
+        if frame is not None:
             height, width = frame.shape[:2]
             thumb_height = max_height
             thumb_width = int(width * thumb_height / height)
-            thumbnail = cv2.resize(frame, (thumb_width, thumb_height))
+            # OpenCV's default bilinear filter, made explicit; plenty for a small preview
+            thumbnail = cv2.resize(frame, (thumb_width, thumb_height), interpolation=cv2.INTER_LINEAR)
             
             # Convert to JPEG and encode as base64
             _, buffer = cv2.imencode('.jpg', thumbnail)
-            thumbnail_b64 = base64.b64encode(buffer).decode('ascii')
+            thumbnail_b64 = fast_b64encode(buffer).decode('ascii')
         
-        cap.release()
         return thumbnail_b64, thumb_width, thumb_height
     
+    @contextmanager
+    def _map_input(self, path: str) -> Iterator[Union[bytes, mmap.mmap]]:
+        """
+        Map a file read-only for encoders
+
+        The mapping (or slices of it) is handed straight to b64encode, which
+        reads it from the page cache instead of a separately read copy.
+        """
+        with open(path, 'rb') as f:
+            fd = f.fileno()
+            if hasattr(os, 'posix_fadvise'):
+                # Ask the kernel for aggressive read-ahead on a one-pass scan
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            # mmap refuses zero-length files
+            if os.fstat(fd).st_size == 0:
+                yield b""
+                return
+
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as data:
+                yield data
+    
+    @contextmanager
+    def _open_output(self, path: str, size_hint: int = 0) -> Iterator[BinaryIO]:
+        """
+        Open an SVG output for binary writing, gzip-compressed for '.svgz' paths
+
+        For plain files a size_hint reserves the space up front; anything
+        left unused is truncated away when the file is closed. If the body
+        raises, the partial output is removed rather than left looking like
+        a complete SVG.
+        """
+        # Open outside the cleanup below: if opening fails, whatever file is
+        # already at path was never touched and must not be deleted
+        compressed = path.lower().endswith('.svgz')
+        if compressed:
+            f = gzip.open(path, 'wb', compresslevel=self.SVGZ_COMPRESSLEVEL)
+        else:
+            f = open(path, 'wb', buffering=self.OUTPUT_BUFFER_SIZE)
+
+        try:
+            with f:
+                if not compressed:
+                    self._preallocate(f, size_hint)
+                yield f
+                if size_hint and not compressed:
+                    f.truncate()
+        except BaseException:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            raise
+    
+    @staticmethod
+    def _open_svg(path: str) -> TextIO:
+        """Open an SVG, or a gzip-compressed '.svgz', for reading as text"""
+        if path.lower().endswith('.svgz'):
+            return gzip.open(path, 'rt', encoding='utf-8')
+        return open(path, 'r', encoding='utf-8')
+    
+    @staticmethod
+    def _preallocate(f: BinaryIO, size: int) -> None:
+        """Reserve size bytes for an output file up front where the OS supports it"""
+        if size <= 0 or not hasattr(os, 'posix_fallocate'):
+            return
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass  # Not supported by every filesystem; writes still extend the file
+    
     def _validate_input(self, mp4_path: str) -> None:
         """Validate input MP4 file"""
         if not os.path.exists(mp4_path):
@@ -66,6 +235,11 @@ class BaseConverter(ABC):
         if not mp4_path.lower().endswith('.mp4'):
             raise ValueError("Input file must be an MP4 video")
         
+        # A parseable video track already proves the file is usable and the
+        # converter's own probe follows; only open a decoder as a fallback
+        if read_mp4_metadata(mp4_path) is not None:
+            return
+        
         # Test if file can be opened
         cap = cv2.VideoCapture(mp4_path)
         if not cap.isOpened():
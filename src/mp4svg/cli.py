@@ -6,12 +6,17 @@ Command-line interface for mp4svg
 import argparse
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 from . import (
     get_converter, list_converters, CONVERTER_REGISTRY,
     EncodingError, DecodingError
 )
 
+# Methods whose converters gzip their output for '.svgz' paths
+SVGZ_METHODS = ('polyglot', 'ascii85', 'base64')
+
 
 def main():
     """Command line interface for MP4 to SVG converters"""
@@ -33,11 +38,13 @@ Examples:
   mp4svg video.mp4 output.svg --method base64
   mp4svg video.mp4 output.svg --method vector --max-frames 30
   mp4svg video.mp4 output_dir/ --method hybrid
+  mp4svg videos/*.mp4 output_dir/ --method ascii85 --jobs 4
+  mp4svg video.mp4 output.svg --method base64 --svgz
         '''
     )
 
-    parser.add_argument('input', help='Input MP4 file')
-    parser.add_argument('output', help='Output SVG file or directory (for hybrid)')
+    parser.add_argument('input', nargs='+', help='Input MP4 file(s)')
+    parser.add_argument('output', help='Output SVG file, or directory (for hybrid or several inputs)')
     parser.add_argument('--method', '-m',
                         choices=['polyglot', 'ascii85', 'vector', 'qr', 'hybrid', 'base64'],
                         default='polyglot',
@@ -51,16 +58,27 @@ Examples:
                         help='Chunk size for QR method (default: 1024)')
     parser.add_argument('--extract', action='store_true',
                         help='Extract MP4 from SVG instead of converting')
+    parser.add_argument('--force', action='store_true',
+                        help='Write base64 SVGs even if too large for browsers to open')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Parallel conversions when several inputs are given (default: 1)')
+    parser.add_argument('--svgz', action='store_true',
+                        help='Write gzip-compressed .svgz output (polyglot, ascii85 and base64 only)')
 
     args = parser.parse_args()
 
-    # Check input file
-    if not os.path.exists(args.input):
-        print(f"Error: Input file '{args.input}' not found")
-        sys.exit(1)
+    # Check input files
+    for input_path in args.input:
+        if not os.path.exists(input_path):
+            print(f"Error: Input file '{input_path}' not found")
+            sys.exit(1)
 
     # Handle extraction mode
     if args.extract:
+        if len(args.input) > 1:
+            print("Error: --extract takes a single input file")
+            sys.exit(1)
+        args.input = args.input[0]
         if args.method == 'polyglot':
             converter_class = get_converter('polyglot')
             converter = converter_class()
@@ -73,36 +91,102 @@ Examples:
             print(f"Extraction not implemented for method: {args.method}")
         return
 
+    if args.svgz and args.method not in SVGZ_METHODS:
+        print(f"Error: --svgz is not supported for method: {args.method}")
+        sys.exit(1)
+
     # Handle conversion
+    if len(args.input) == 1:
+        try:
+            _convert_one(args, args.input[0], _svgz_path(args, args.output))
+        except EncodingError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        return
+
+    # Several inputs: write one SVG per video into the output directory.
+    # Outputs are named after each input's basename, so inputs sharing a
+    # name (e.g. a/x.mp4 and b/x.mp4) would overwrite one another
+    names = Counter(_output_name(path) for path in args.input)
+    clashing = [path for path in args.input if names[_output_name(path)] > 1]
+    if clashing:
+        print(f"Error: inputs would overwrite each other's output: {', '.join(clashing)}")
+        sys.exit(1)
+
+    os.makedirs(args.output, exist_ok=True)
+    outputs = [_batch_output_path(args, path) for path in args.input]
+
+    if args.jobs > 1:
+        # Videos are independent, so convert them in separate processes
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [executor.submit(_convert_one, args, path, output)
+                       for path, output in zip(args.input, outputs)]
+            outcomes = [(path, future.exception()) for path, future in zip(args.input, futures)]
+        errors = [(path, error) for path, error in outcomes if error is not None]
+    else:
+        errors = []
+        for path, output in zip(args.input, outputs):
+            try:
+                _convert_one(args, path, output)
+            except Exception as e:
+                errors.append((path, e))
+
+    if errors:
+        for path, error in errors:
+            print(f"Error: {path}: {error}")
+        sys.exit(1)
+
+
+def _batch_output_path(args, input_path):
+    """Output path for one of several inputs"""
+    if args.method == 'hybrid':
+        return args.output  # Hybrid already writes <name>_<method>.svg into a directory
+    return _svgz_path(args, os.path.join(args.output, f"{_output_name(input_path)}.svg"))
+
+
+def _output_name(input_path):
+    """Base name shared by every output written for an input"""
+    return os.path.splitext(os.path.basename(input_path))[0]
+
+
+def _svgz_path(args, output_path):
+    """Swap the output extension to '.svgz' when --svgz is given"""
+    if not args.svgz or output_path.lower().endswith('.svgz'):
+        return output_path
+    return f"{os.path.splitext(output_path)[0]}.svgz"
+
+
+def _convert_one(args, input_path, output_path):
+    """Convert a single video with the method selected on the command line"""
     if args.method == 'polyglot':
         converter_class = get_converter('polyglot')
         converter = converter_class()
-        converter.convert(args.input, args.output, args.pdf)
+        converter.convert(input_path, output_path, args.pdf)
 
     elif args.method == 'ascii85':
         converter_class = get_converter('ascii85')
         converter = converter_class()
-        converter.convert(args.input, args.output)
+        converter.convert(input_path, output_path)
 
     elif args.method == 'vector':
         converter_class = get_converter('vector')
         converter = converter_class()
-        converter.convert(args.input, args.output, args.max_frames, args.edge_threshold)
+        converter.convert(input_path, output_path, args.max_frames, args.edge_threshold)
 
     elif args.method == 'qr':
         converter_class = get_converter('qrcode')
         converter = converter_class(chunk_size=args.chunk_size)
-        converter.convert(args.input, args.output)
+        converter.convert(input_path, output_path)
 
     elif args.method == 'hybrid':
         converter_class = get_converter('hybrid')
         converter = converter_class()
-        converter.convert(args.input, args.output)
+        converter.convert(input_path, output_path)
 
     elif args.method == 'base64':
         converter_class = get_converter('base64')
         converter = converter_class()
-        converter.convert(args.input, args.output)
+        converter.convert(input_path, output_path, force=args.force)
 
     else:
         available_methods = list_converters()
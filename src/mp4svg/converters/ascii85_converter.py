@@ -4,230 +4,20 @@ Provides 25% overhead vs 33% for base64
 """
 
 import os
-import struct
-import base64
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import numpy as np
 from lxml import etree
-from ..base import BaseConverter, EncodingError, DecodingError
+from ..base import BaseConverter, EncodingError, DecodingError, fast_b64decode, fast_b64encode
 
+# Place values of the five base-85 digits in one ASCII85 group
+_POWERS_OF_85 = np.array([85 ** 4, 85 ** 3, 85 ** 2, 85, 1], dtype=np.uint32)
 
-class ASCII85SVGConverter(BaseConverter):
-    """Converts MP4 to SVG using ASCII85 encoding (25% overhead vs 33% for base64)"""
-
-    def convert(self, mp4_path: str, output_path: str, **kwargs) -> str:
-        """Convert MP4 to SVG with ASCII85 encoding"""
-        
-        self._validate_input(mp4_path)
-        print(f"[ASCII85] Processing {mp4_path}...")
-
-        # Read video data
-        with open(mp4_path, 'rb') as f:
-            mp4_data = f.read()
-
-        try:
-            # Encode using ASCII85
-            encoded = self._encode_ascii85(mp4_data)
-            
-            # Base64 encode for XML safety
-            encoded_b64 = base64.b64encode(encoded.encode('ascii')).decode('ascii')
-            
-            # Create thumbnail for preview
-            thumbnail_b64, thumb_width, thumb_height = self._create_thumbnail(mp4_path)
-            
-            # Get video metadata
-            metadata = self._get_video_metadata(mp4_path)
-            
-            # Generate SVG content
-            svg_content = self._generate_svg(
-                mp4_data, encoded_b64, thumbnail_b64, thumb_width, thumb_height, metadata
-            )
-            
-            # Write to file
-            with open(output_path, 'w') as f:
-                f.write(svg_content)
-
-            print(f"[ASCII85] Created: {output_path}")
-            print(f"[ASCII85] Original: {len(mp4_data):,} bytes")
-            print(f"[ASCII85] Encoded: {len(encoded):,} chars")
-            print(f"[ASCII85] Overhead: {(len(encoded) / len(mp4_data) - 1) * 100:.1f}%")
-            if thumbnail_b64:
-                print(f"[ASCII85] Added thumbnail: {len(thumbnail_b64)} chars")
-
-            return output_path
-            
-        except Exception as e:
-            raise EncodingError(f"ASCII85 encoding failed: {str(e)}")
-
-    def extract(self, svg_path: str, output_mp4: str) -> bool:
-        """Extract MP4 from ASCII85 encoded SVG"""
-        
-        try:
-            tree = etree.parse(svg_path)
-            root = tree.getroot()
-
-            # Find video data
-            ns = {'video': 'http://example.org/video/2024'}
-            video_data = root.find('.//video:data', ns)
-
-            if video_data is None:
-                print("[ASCII85] No video data found")
-                return False
-
-            encoded = video_data.text.strip()
-            decoded_b64 = base64.b64decode(encoded).decode('ascii')
-            decoded = self._decode_ascii85(decoded_b64)
-
-            with open(output_mp4, 'wb') as f:
-                f.write(decoded)
-
-            print(f"[ASCII85] Extracted to {output_mp4}")
-            return True
-            
-        except Exception as e:
-            raise DecodingError(f"ASCII85 extraction failed: {str(e)}")
-
-    def _encode_ascii85(self, data: bytes) -> str:
-        """Encode binary data using ASCII85"""
-        
-        encoded = []
-        original_length = len(data)
-
-        # Process in 4-byte chunks
-        for i in range(0, len(data), 4):
-            chunk = data[i:i + 4]
-
-            # Pad if necessary
-            if len(chunk) < 4:
-                chunk = chunk + b'\x00' * (4 - len(chunk))
-
-            # Convert to 32-bit integer
-            value = struct.unpack('>I', chunk)[0]
-
-            # Special case for all zeros
-            if value == 0 and i + 4 <= len(data):
-                encoded.append('z')
-            else:
-                # Convert to base 85
-                chars = []
-                for _ in range(5):
-                    chars.append(chr(33 + (value % 85)))
-                    value //= 85
-                encoded.append(''.join(reversed(chars)))
-
-        # Simple approach: store original length as decimal prefix separated by ':'
-        result = f'<~{original_length}:' + ''.join(encoded) + '~>'
-        return result
-
-    def _decode_ascii85(self, encoded: str) -> bytes:
-        """Decode ASCII85 string to bytes"""
-        
-        # Remove delimiters
-        if encoded.startswith('<~'):
-            encoded = encoded[2:]
-        if encoded.endswith('~>'):
-            encoded = encoded[:-2]
-
-        # Extract original length from prefix
-        length_prefix_end = encoded.find(':')
-        original_length = int(encoded[:length_prefix_end])
-        encoded = encoded[length_prefix_end + 1:]
-
-        decoded = []
-        i = 0
-        
-        while i < len(encoded):
-            if encoded[i] == 'z':
-                decoded.extend([0, 0, 0, 0])
-                i += 1
-            else:
-                # Process 5 characters
-                chunk = encoded[i:i + 5]
-                padding_chars = 0
-                if len(chunk) < 5:
-                    padding_chars = 5 - len(chunk)
-                    chunk += 'u' * padding_chars
-
-                value = 0
-                for char in chunk:
-                    value = value * 85 + (ord(char) - 33)
-
-                # Convert back to 4 bytes
-                chunk_bytes = struct.pack('>I', value)
-                
-                # If this is the last chunk and we had padding, remove corresponding bytes
-                if i + 5 >= len(encoded) and padding_chars > 0:
-                    chunk_bytes = chunk_bytes[:4-padding_chars]
-                
-                decoded.extend(chunk_bytes)
-                i += 5
-
-        # Trim decoded data to original length
-        decoded = decoded[:original_length]
-        
-        return bytes(decoded)
-
-    def _generate_svg(self, mp4_data: bytes, encoded_b64: str, thumbnail_b64: str, 
-                      thumb_width: int, thumb_height: int, metadata: dict) -> str:
-        """Generate SVG content with embedded video data"""
-        
-        width = metadata['width']
-        height = metadata['height']
-        fps = metadata['fps']
-        frame_count = metadata['frame_count']
-        
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg"
-     xmlns:video="http://example.org/video/2024"
-     width="{width}" height="{height}">
-
-    <title>ASCII85 Encoded Video</title>
-    <desc>Video data encoded with ASCII85 (25% overhead)</desc>
-
-    <metadata>
-        <video:data encoding="ascii85" 
-                    originalSize="{len(mp4_data)}"
-                    fps="{fps}"
-                    frames="{frame_count}"
-                    id="videoData">
-            <![CDATA[
-{encoded_b64}
-            ]]>
-        </video:data>
-    </metadata>
-
-    <defs>
-        <style>
-            .container {{ fill: #1a1a1a; }}
-            .title {{ fill: #0f0; font-size: 24px; text-anchor: middle; }}
-            .info {{ fill: #0f0; font-size: 14px; text-anchor: middle; }}
-            .efficiency {{ fill: #ff0; font-size: 12px; text-anchor: middle; }}
-            .play-btn {{ fill: #00ff00; cursor: pointer; }}
-            .play-btn:hover {{ fill: #00cc00; }}
-            .thumbnail {{ cursor: pointer; }}
-        </style>
-    </defs>
-
-    <rect width="100%" height="100%" class="container"/>
-    
-    <!-- Thumbnail preview -->
-    <image x="10" y="10" width="{thumb_width if thumbnail_b64 else 160}" height="{thumb_height if thumbnail_b64 else 90}" 
-           href="data:image/jpeg;base64,{thumbnail_b64}" class="thumbnail" id="thumbnailImage" 
-           style="display: {'block' if thumbnail_b64 else 'none'}"/>
-    
-    <text x="50%" y="30%" class="title">ASCII85 Video Container</text>
-    <text x="50%" y="40%" class="info">Size: {len(mp4_data):,} bytes → {len(encoded_b64):,} chars</text>
-    <text x="50%" y="45%" class="efficiency">Efficiency: 25% overhead (vs 133% for base64)</text>
-    
-    <!-- Play button -->
-    <g id="playButton" class="play-btn">
-        <circle cx="50%" cy="60%" r="30" fill="none" stroke="#00ff00" stroke-width="2"/>
-        <polygon points="{width//2-10},{height*0.6-15} {width//2-10},{height*0.6+15} {width//2+15},{height*0.6}" fill="#00ff00"/>
-        <text x="50%" y="75%" class="info">Click to decode and play video</text>
-    </g>
-
-    <script type="text/javascript">
+# Client-side decoder and player; identical for every SVG, so built once
+_JS_PLAYER = '''<script type="text/javascript">
     <![CDATA[
         // ASCII85 decoder implementation with length prefix support
-        function decodeASCII85(encoded) {{
+        function decodeASCII85(encoded) {
             if (encoded.startsWith('<~')) encoded = encoded.substring(2);
             if (encoded.endsWith('~>')) encoded = encoded.substring(0, encoded.length - 2);
             
@@ -241,51 +31,51 @@ class ASCII85SVGConverter(BaseConverter):
             const decoded = [];
             let i = 0;
             
-            while (i < encoded.length) {{
-                if (encoded[i] === 'z') {{
+            while (i < encoded.length) {
+                if (encoded[i] === 'z') {
                     decoded.push(0, 0, 0, 0);
                     i++;
-                }} else {{
+                } else {
                     let chunk = encoded.substring(i, i + 5);
                     if (chunk.length < 5) chunk += 'u'.repeat(5 - chunk.length);
                     
                     let value = 0;
-                    for (let j = 0; j < chunk.length; j++) {{
+                    for (let j = 0; j < chunk.length; j++) {
                         value = value * 85 + (chunk.charCodeAt(j) - 33);
-                    }}
+                    }
                     
                     decoded.push(
                         (value >>> 24) & 0xFF, (value >>> 16) & 0xFF,
                         (value >>> 8) & 0xFF, value & 0xFF
                     );
                     i += 5;
-                }}
-            }}
+                }
+            }
             
             // Trim to original length to remove padding
             const result = new Uint8Array(decoded.slice(0, originalLength));
             console.log('Decoded ASCII85: ' + encoded.length + ' chars -> ' + result.length + ' bytes (expected: ' + originalLength + ')');
             return result;
-        }}
+        }
         
-        function decodeAndPlayVideo() {{
-            try {{
+        function decodeAndPlayVideo() {
+            try {
                 console.log('Decoding ASCII85 video data...');
                 
                 let videoData = document.getElementById('videoData');
-                if (!videoData) {{
+                if (!videoData) {
                     const metadataElements = document.getElementsByTagNameNS('http://example.org/video/2024', 'data');
                     if (metadataElements && metadataElements.length > 0) videoData = metadataElements[0];
-                }}
-                if (!videoData) {{
+                }
+                if (!videoData) {
                     const allElements = document.getElementsByTagName('*');
-                    for (let element of allElements) {{
-                        if (element.localName === 'data' && element.namespaceURI === 'http://example.org/video/2024') {{
+                    for (let element of allElements) {
+                        if (element.localName === 'data' && element.namespaceURI === 'http://example.org/video/2024') {
                             videoData = element;
                             break;
-                        }}
-                    }}
-                }}
+                        }
+                    }
+                }
                 
                 if (!videoData) throw new Error('Video data element not found in SVG');
                 
@@ -297,7 +87,7 @@ class ASCII85SVGConverter(BaseConverter):
                 // Then decode ASCII85 to get binary data
                 const decodedBytes = decodeASCII85(ascii85Data);
                 
-                const videoUrl = URL.createObjectURL(new Blob([decodedBytes], {{ type: 'video/mp4' }}));
+                const videoUrl = URL.createObjectURL(new Blob([decodedBytes], { type: 'video/mp4' }));
                 
                 console.log('Creating video container...');
                 
@@ -311,66 +101,66 @@ class ASCII85SVGConverter(BaseConverter):
                 
                 // Build HTML video player content programmatically (avoid innerHTML XML parsing issues)
                 const overlay = document.createElement('div');
-                if (overlay.style && overlay.style.cssText !== undefined) {{
+                if (overlay.style && overlay.style.cssText !== undefined) {
                     overlay.style.cssText = 'position: absolute; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.9); z-index: 10000;';
-                }} else {{
+                } else {
                     overlay.setAttribute('style', 'position: absolute; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.9); z-index: 10000;');
-                }}
+                }
                 
                 const centered = document.createElement('div');
-                if (centered.style && centered.style.cssText !== undefined) {{
+                if (centered.style && centered.style.cssText !== undefined) {
                     centered.style.cssText = 'position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); width: 90%; max-width: 800px;';
-                }} else {{
+                } else {
                     centered.setAttribute('style', 'position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); width: 90%; max-width: 800px;');
-                }}
+                }
                 
                 const panel = document.createElement('div');
-                if (panel.style && panel.style.cssText !== undefined) {{
+                if (panel.style && panel.style.cssText !== undefined) {
                     panel.style.cssText = 'background: #000; padding: 20px; border-radius: 10px; box-shadow: 0 4px 20px rgba(0,0,0,0.5);';
-                }} else {{
+                } else {
                     panel.setAttribute('style', 'background: #000; padding: 20px; border-radius: 10px; box-shadow: 0 4px 20px rgba(0,0,0,0.5);');
-                }}
+                }
                 
                 const title = document.createElement('div');
-                if (title.style && title.style.cssText !== undefined) {{
+                if (title.style && title.style.cssText !== undefined) {
                     title.style.cssText = 'color: white; margin-bottom: 10px; font-family: Arial, sans-serif; font-size: 16px;';
-                }} else {{
+                } else {
                     title.setAttribute('style', 'color: white; margin-bottom: 10px; font-family: Arial, sans-serif; font-size: 16px;');
-                }}
+                }
                 title.textContent = ' Mp4svg Video Player';
                 
                 const video = document.createElement('video');
                 video.setAttribute('controls', 'true');
                 video.setAttribute('autoplay', 'true');
-                if (video.style && video.style.cssText !== undefined) {{
+                if (video.style && video.style.cssText !== undefined) {
                     video.style.cssText = 'width: 100%; height: auto; border-radius: 5px;';
-                }} else {{
+                } else {
                     video.setAttribute('style', 'width: 100%; height: auto; border-radius: 5px;');
-                }}
+                }
                 video.src = videoUrl;
                 
                 const buttonDiv = document.createElement('div');
-                if (buttonDiv.style && buttonDiv.style.cssText !== undefined) {{
+                if (buttonDiv.style && buttonDiv.style.cssText !== undefined) {
                     buttonDiv.style.cssText = 'margin-top: 10px; text-align: right;';
-                }} else {{
+                } else {
                     buttonDiv.setAttribute('style', 'margin-top: 10px; text-align: right;');
-                }}
+                }
                 
                 const closeButton = document.createElement('button');
-                if (closeButton.style && closeButton.style.cssText !== undefined) {{
+                if (closeButton.style && closeButton.style.cssText !== undefined) {
                     closeButton.style.cssText = 'background: #f44336; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer; font-family: Arial, sans-serif;';
-                }} else {{
+                } else {
                     closeButton.setAttribute('style', 'background: #f44336; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer; font-family: Arial, sans-serif;');
-                }}
+                }
                 closeButton.textContent = ' Close';
                 closeButton.onclick = () => foreignObject.remove();
                 
                 const info = document.createElement('div');
-                if (info.style && info.style.cssText !== undefined) {{
+                if (info.style && info.style.cssText !== undefined) {
                     info.style.cssText = 'color: #888; margin-top: 5px; font-family: Arial, sans-serif; font-size: 12px;';
-                }} else {{
+                } else {
                     info.setAttribute('style', 'color: #888; margin-top: 5px; font-family: Arial, sans-serif; font-size: 12px;');
-                }}
+                }
                 info.textContent = 'Video loaded from IndexedDB • Embedded in SVG foreignObject';
                 
                 // Build DOM structure
@@ -385,39 +175,268 @@ class ASCII85SVGConverter(BaseConverter):
                 
                 // Add foreignObject to the SVG
                 const svgElement = document.querySelector('svg');
-                if (svgElement) {{
+                if (svgElement) {
                     svgElement.appendChild(foreignObject);
                     console.log('In-SVG video player created successfully');
                     
                     // Remove the play overlay since we now have a proper player
-                    try {{
-                        if (playOverlay && playOverlay.parentNode) {{
+                    try {
+                        if (playOverlay && playOverlay.parentNode) {
                             playOverlay.remove();
-                        }}
-                    }} catch (e) {{
+                        }
+                    } catch (e) {
                         console.log('Play overlay already removed or not found');
-                    }}
-                }} else {{
+                    }
+                } else {
                     console.error('SVG element not found for foreignObject player');
                     // Fallback to download
                     const link = document.createElement('a');
                     link.href = videoUrl;
                     link.download = 'extracted_video.mp4';
                     link.click();
-                }}
-            }} catch (error) {{
+                }
+            } catch (error) {
                 console.error('Error decoding video:', error);
                 alert('Error decoding video: ' + error.message);
-            }}
-        }}
+            }
+        }
         
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             const playButton = document.getElementById('playButton');
             const thumbnail = document.getElementById('thumbnailImage');
             
             if (playButton) playButton.addEventListener('click', decodeAndPlayVideo);
             if (thumbnail) thumbnail.addEventListener('click', decodeAndPlayVideo);
-        }});
+        });
     ]]>
-    </script>
+    </script>'''
+
+
+class ASCII85SVGConverter(BaseConverter):
+    """Converts MP4 to SVG using ASCII85 encoding (25% overhead vs 33% for base64)"""
+
+    # Input bytes encoded per numpy pass; a multiple of the 4-byte group size
+    ENCODE_BLOCK_SIZE = 4 * 1024 * 1024
+
+    def convert(self, mp4_path: str, output_path: str, **kwargs) -> str:
+        """Convert MP4 to SVG with ASCII85 encoding"""
+        
+        self._validate_input(mp4_path)
+        print(f"[ASCII85] Processing {mp4_path}...")
+
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Get video metadata and first frame in one pass; OpenCV and
+                # numpy both release the GIL, so this overlaps the encoding
+                probe = executor.submit(self._probe_video, mp4_path)
+                
+                # Encode using ASCII85 straight from a read-only mapping of the video
+                with self._map_input(mp4_path) as mp4_data:
+                    original_size = len(mp4_data)
+                    encoded = self._encode_ascii85_bytes(mp4_data)
+                
+                # Base64 encode for XML safety; kept as bytes for the binary writer
+                encoded_b64 = fast_b64encode(encoded)
+                
+                metadata, first_frame = probe.result()
+            
+            # Create thumbnail for preview
+            thumbnail_b64, thumb_width, thumb_height = self._encode_thumbnail(first_frame)
+            
+            # Generate SVG content as fragments around the encoded payload
+            svg_parts = self._generate_svg(
+                original_size, encoded_b64, thumbnail_b64, thumb_width, thumb_height, metadata
+            )
+            
+            # Write to file; fragments are already UTF-8 so nothing is re-encoded
+            with self._open_output(output_path) as f:
+                f.writelines(svg_parts)
+
+            print(f"[ASCII85] Created: {output_path}")
+            print(f"[ASCII85] Original: {original_size:,} bytes")
+            print(f"[ASCII85] Encoded: {len(encoded):,} chars")
+            print(f"[ASCII85] Overhead: {(len(encoded) / original_size - 1) * 100:.1f}%")
+            if thumbnail_b64:
+                print(f"[ASCII85] Added thumbnail: {len(thumbnail_b64)} chars")
+
+            return output_path
+            
+        except Exception as e:
+            raise EncodingError(f"ASCII85 encoding failed: {str(e)}")
+
+    def extract(self, svg_path: str, output_mp4: str) -> bool:
+        """Extract MP4 from ASCII85 encoded SVG"""
+        
+        try:
+            tree = etree.parse(svg_path)
+            root = tree.getroot()
+
+            # Find video data
+            ns = {'video': 'http://example.org/video/2024'}
+            video_data = root.find('.//video:data', ns)
+
+            if video_data is None:
+                print("[ASCII85] No video data found")
+                return False
+
+            encoded = video_data.text.strip()
+            decoded_b64 = fast_b64decode(encoded).decode('ascii')
+            decoded = self._decode_ascii85(decoded_b64)
+
+            with open(output_mp4, 'wb') as f:
+                f.write(decoded)
+
+            print(f"[ASCII85] Extracted to {output_mp4}")
+            return True
+            
+        except Exception as e:
+            raise DecodingError(f"ASCII85 extraction failed: {str(e)}")
+
+    def _encode_ascii85(self, data: bytes) -> str:
+        """Encode binary data using ASCII85"""
+        return self._encode_ascii85_bytes(data).decode('ascii')
+
+    def _encode_ascii85_bytes(self, data: bytes) -> bytes:
+        """Encode binary data using ASCII85, returning the ASCII output as bytes"""
+        
+        original_length = len(data)
+        
+        # Simple approach: store original length as decimal prefix separated by ':'
+        parts = [b'<~%d:' % original_length]
+        
+        # Encode in bounded blocks so the numpy temporaries stay a small
+        # multiple of the block size instead of the whole video. Full groups
+        # are viewed straight from the caller's buffer (e.g. an mmap), no copy
+        full_groups = original_length // 4
+        block_groups = self.ENCODE_BLOCK_SIZE // 4
+        for start in range(0, full_groups, block_groups):
+            count = min(block_groups, full_groups - start)
+            values = np.frombuffer(data, dtype='>u4', count=count, offset=start * 4)
+            parts.append(self._encode_groups(values, count))
+        
+        # Only the final partial group needs zero padding
+        tail = data[full_groups * 4:]
+        if tail:
+            padded = bytes(tail) + bytes(4 - len(tail))
+            parts.append(self._encode_groups(np.frombuffer(padded, dtype='>u4'), 0))
+        
+        parts.append(b'~>')
+        return b''.join(parts)
+
+    @staticmethod
+    def _encode_groups(values: np.ndarray, full_groups: int) -> bytes:
+        """Encode 32-bit groups to base 85; only the first full_groups may use 'z'"""
+        
+        # Convert every group to base 85 at once, most significant digit first
+        values = values.astype(np.uint32)
+        chars = ((values[:, None] // _POWERS_OF_85) % 85 + 33).astype(np.uint8)
+        
+        # Special case for all zeros (full groups only): emit a single 'z'
+        zero_groups = values == 0
+        zero_groups[full_groups:] = False
+        if not zero_groups.any():
+            return chars.tobytes()
+        chars[zero_groups, 0] = ord('z')
+        keep = np.ones(chars.shape, dtype=bool)
+        keep[zero_groups, 1:] = False
+        return chars[keep].tobytes()
+
+    def _decode_ascii85(self, encoded: str) -> bytes:
+        """Decode ASCII85 string to bytes"""
+        
+        # Remove delimiters
+        if encoded.startswith('<~'):
+            encoded = encoded[2:]
+        if encoded.endswith('~>'):
+            encoded = encoded[:-2]
+
+        # Extract original length from prefix
+        length_prefix_end = encoded.find(':')
+        original_length = int(encoded[:length_prefix_end])
+        encoded = encoded[length_prefix_end + 1:]
+
+        # 'z' is shorthand for '!!!!!' (a zero group); pad the tail group with 'u'
+        encoded = encoded.replace('z', '!!!!!')
+        encoded += 'u' * (-len(encoded) % 5)
+        
+        digits = np.frombuffer(encoded.encode('ascii'), dtype=np.uint8).reshape(-1, 5)
+        values = (digits.astype(np.uint64) - 33) @ _POWERS_OF_85.astype(np.uint64)
+        
+        # Trim decoded data to original length
+        return values.astype('>u4').tobytes()[:original_length]
+
+    def _generate_svg(self, original_size: int, encoded_b64: bytes, thumbnail_b64: str, 
+                      thumb_width: int, thumb_height: int, metadata: dict) -> List[bytes]:
+        """
+        Generate SVG content with embedded video data
+        
+        Returns the document as a list of UTF-8 fragments so the (large)
+        encoded payload is written as-is instead of being copied into one
+        big string or passed through a text encoder.
+        """
+        
+        width = metadata['width']
+        height = metadata['height']
+        fps = metadata['fps']
+        frame_count = metadata['frame_count']
+        # Play icon centre, matching the button circle at (50%, 60%); integer
+        # math keeps the coordinates short and free of float formatting
+        play_x = width // 2
+        play_y = height * 3 // 5
+        
+        svg_head = f'''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg"
+     xmlns:video="http://example.org/video/2024"
+     width="{width}" height="{height}">
+
+    <title>ASCII85 Encoded Video</title>
+    <desc>Video data encoded with ASCII85 (25% overhead)</desc>
+
+    <metadata>
+        <video:data encoding="ascii85" 
+                    originalSize="{original_size}"
+                    fps="{fps}"
+                    frames="{frame_count}"
+                    id="videoData">
+            <![CDATA[
+'''
+        
+        svg_tail = f'''
+            ]]>
+        </video:data>
+    </metadata>
+
+    <defs>
+        <style>
+            .container {{ fill: #1a1a1a; }}
+            .title {{ fill: #0f0; font-size: 24px; text-anchor: middle; }}
+            .info {{ fill: #0f0; font-size: 14px; text-anchor: middle; }}
+            .efficiency {{ fill: #ff0; font-size: 12px; text-anchor: middle; }}
+            .play-btn {{ fill: #00ff00; cursor: pointer; }}
+            .play-btn:hover {{ fill: #00cc00; }}
+            .thumbnail {{ cursor: pointer; }}
+        </style>
+    </defs>
+
+    <rect width="100%" height="100%" class="container"/>
+    
+    <!-- Thumbnail preview -->
+    <image x="10" y="10" width="{thumb_width if thumbnail_b64 else 160}" height="{thumb_height if thumbnail_b64 else 90}" 
+           href="data:image/jpeg;base64,{thumbnail_b64}" class="thumbnail" id="thumbnailImage" 
+           style="display: {'block' if thumbnail_b64 else 'none'}"/>
+    
+    <text x="50%" y="30%" class="title">ASCII85 Video Container</text>
+    <text x="50%" y="40%" class="info">Size: {original_size:,} bytes → {len(encoded_b64):,} chars</text>
+    <text x="50%" y="45%" class="efficiency">Efficiency: 25% overhead (vs 133% for base64)</text>
+    
+    <!-- Play button -->
+    <g id="playButton" class="play-btn">
+        <circle cx="50%" cy="60%" r="30" fill="none" stroke="#00ff00" stroke-width="2"/>
+        <polygon points="{play_x-10},{play_y-15} {play_x-10},{play_y+15} {play_x+15},{play_y}" fill="#00ff00"/>
+        <text x="50%" y="75%" class="info">Click to decode and play video</text>
+    </g>
+
+    {_JS_PLAYER}
 </svg>'''
+        
+        return [svg_head.encode('utf-8'), encoded_b64, svg_tail.encode('utf-8')]
@@ -82,7 +82,7 @@ class HybridSVGConverter(BaseConverter):
         print(f"[Hybrid] Analyzing {svg_path} to detect format...")
         
         try:
-            with open(svg_path, 'r', encoding='utf-8') as f:
+            with self._open_svg(svg_path) as f:
                 content = f.read()
             
             # Detect format based on content
@@ -7,12 +7,15 @@ import os
 import hashlib
 from typing import Optional
 from lxml import etree
-from ..base import BaseConverter, EncodingError, DecodingError
+from ..base import BaseConverter, EncodingError, DecodingError, fast_b64decode, fast_b64encode
 
 
 class PolyglotSVGConverter(BaseConverter):
     """Creates SVG files that contain hidden MP4 data"""
 
+    # Bytes encoded per step; 60 bytes make one full 80-character line
+    STREAM_CHUNK_SIZE = 60 * 16 * 1024
+
     def __init__(self):
         self.boundary = f"POLYGLOT_BOUNDARY_{hashlib.md5(os.urandom(16)).hexdigest()}"
 
@@ -23,57 +26,46 @@ class PolyglotSVGConverter(BaseConverter):
         print(f"[Polyglot] Processing {mp4_path}...")
 
         try:
-            # Read MP4 data
-            with open(mp4_path, 'rb') as f:
-                mp4_data = f.read()
+            mp4_size = os.path.getsize(mp4_path)
 
-            # Read PDF data if provided
-            pdf_data = b""
+            # Check for PDF data if provided
+            pdf_size = 0
             if pdf_path and os.path.exists(pdf_path):
-                with open(pdf_path, 'rb') as f:
-                    pdf_data = f.read()
+                pdf_size = os.path.getsize(pdf_path)
                 print(f"[Polyglot] Including PDF: {pdf_path}")
 
             # Create SVG template
             svg_content = self._create_svg_template(mp4_path)
-            
-            # Encode binary data for SVG comments
-            mp4_encoded = self._encode_for_svg_comment(mp4_data)
-            pdf_encoded = self._encode_for_svg_comment(pdf_data) if pdf_data else ""
-
-            # Build polyglot content
-            polyglot_content = f"""<!--{self.boundary}
-<!--MP4_DATA
-{mp4_encoded}
-MP4_DATA-->"""
-
-            if pdf_data:
-                polyglot_content += f"""
-<!--PDF_DATA
-{pdf_encoded}
-PDF_DATA-->"""
-
-            polyglot_content += f"""
+
+            # Stream the payloads into their comments chunk by chunk instead
+            # of holding the whole encoded video in memory
+            with self._open_output(output_path) as f:
+                f.write(f"<!--{self.boundary}\n<!--MP4_DATA\n".encode('utf-8'))
+                self._write_comment_payload(f, mp4_path)
+                f.write(b"\nMP4_DATA-->")
+
+                if pdf_size:
+                    f.write(b"\n<!--PDF_DATA\n")
+                    self._write_comment_payload(f, pdf_path)
+                    f.write(b"\nPDF_DATA-->")
+
+                f.write(f"""
 {self.boundary}-->
 
 {svg_content}
 
 <!--{self.boundary}
 Summary: SVG Polyglot Container
-- Original MP4: {len(mp4_data):,} bytes
+- Original MP4: {mp4_size:,} bytes
 - SVG overhead: ~0% (comments ignored)
-{f"- PDF included: {len(pdf_data):,} bytes" if pdf_data else ""}
-- Total embedded: {len(mp4_data) + len(pdf_data):,} bytes
-{self.boundary}-->"""
-
-            # Write to output file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(polyglot_content)
+{f"- PDF included: {pdf_size:,} bytes" if pdf_size else ""}
+- Total embedded: {mp4_size + pdf_size:,} bytes
+{self.boundary}-->""".encode('utf-8'))
 
             print(f"[Polyglot] Created: {output_path}")
-            print(f"[Polyglot] MP4 size: {len(mp4_data):,} bytes")
-            if pdf_data:
-                print(f"[Polyglot] PDF size: {len(pdf_data):,} bytes")
+            print(f"[Polyglot] MP4 size: {mp4_size:,} bytes")
+            if pdf_size:
+                print(f"[Polyglot] PDF size: {pdf_size:,} bytes")
             print(f"[Polyglot] SVG overhead: ~0% (comment-based)")
 
             return output_path
@@ -85,7 +77,7 @@ Summary: SVG Polyglot Container
         """Extract MP4 from polyglot SVG"""
         
         try:
-            with open(svg_path, 'r', encoding='utf-8') as f:
+            with self._open_svg(svg_path) as f:
                 content = f.read()
 
             # Look for MP4 data markers
@@ -121,8 +113,8 @@ Summary: SVG Polyglot Container
     def _create_svg_template(self, video_path: str) -> str:
         """Create base SVG template with video metadata"""
         
-        metadata = self._get_video_metadata(video_path)
-        thumbnail_b64, thumb_width, thumb_height = self._create_thumbnail(video_path)
+        metadata, first_frame = self._probe_video(video_path)
+        thumbnail_b64, thumb_width, thumb_height = self._encode_thumbnail(first_frame)
         
         return f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" 
@@ -158,26 +150,33 @@ Summary: SVG Polyglot Container
   </text>
 </svg>'''
 
+    def _write_comment_payload(self, f, path: str) -> None:
+        """Stream a file into f as the 80-column base64 body of a comment"""
+        # Slices of a memoryview over the mapping are zero-copy
+        with self._map_input(path) as data, memoryview(data) as view:
+            for offset in range(0, len(view), self.STREAM_CHUNK_SIZE):
+                if offset:
+                    f.write(b'\n')
+                f.write(self._encode_comment_lines(view[offset:offset + self.STREAM_CHUNK_SIZE]))
+
     def _encode_for_svg_comment(self, data: bytes) -> str:
         """Encode binary data for safe inclusion in SVG comments"""
+        return self._encode_comment_lines(data).decode('ascii')
+
+    def _encode_comment_lines(self, data: bytes) -> bytes:
+        """Encode binary data as 80-character base64 lines, kept as ASCII bytes"""
         
-        import base64
         # Use base64 for safe comment embedding
-        encoded = base64.b64encode(data).decode('ascii')
+        encoded = fast_b64encode(data)
         
         # Format in 80-character lines for readability
-        lines = []
-        for i in range(0, len(encoded), 80):
-            lines.append(encoded[i:i + 80])
-        
-        return '\n'.join(lines)
+        return b'\n'.join([encoded[i:i + 80] for i in range(0, len(encoded), 80)])
 
     def _decode_from_svg_comment(self, encoded_data: str) -> bytes:
         """Decode binary data from SVG comment encoding"""
         
-        import base64
         # Remove line breaks and whitespace
         clean_data = ''.join(encoded_data.split())
         
         # Decode from base64
-        return base64.b64decode(clean_data)
+        return fast_b64decode(clean_data)
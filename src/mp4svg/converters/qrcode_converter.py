@@ -6,13 +6,12 @@ Stores data as QR codes embedded in SVG frames (memvid-inspired)
 import os
 import json
 import hashlib
-import base64
 from io import BytesIO
 from typing import List
 import qrcode
 from PIL import Image
 from lxml import etree
-from ..base import BaseConverter, EncodingError, DecodingError
+from ..base import BaseConverter, EncodingError, DecodingError, fast_b64encode, json_loads
 
 
 class QRCodeSVGConverter(BaseConverter):
@@ -79,7 +78,7 @@ class QRCodeSVGConverter(BaseConverter):
             
             for idx, chunk in enumerate(chunks):
                 # Encode chunk as base64 for QR code
-                chunk_b64 = base64.b64encode(chunk).decode('ascii')
+                chunk_b64 = fast_b64encode(chunk).decode('ascii')
                 
                 # Add chunk header with index and checksum
                 chunk_data = {
@@ -118,7 +117,7 @@ class QRCodeSVGConverter(BaseConverter):
                 # Convert QR image to base64
                 qr_buffer = BytesIO()
                 qr_img.save(qr_buffer, format='PNG')
-                qr_base64 = base64.b64encode(qr_buffer.getvalue()).decode('ascii')
+                qr_base64 = fast_b64encode(qr_buffer.getvalue()).decode('ascii')
 
                 image = etree.SubElement(frame_group, 'image', {
                     'x': '0',
@@ -159,7 +158,7 @@ class QRCodeSVGConverter(BaseConverter):
             metadata_elem = root.find('metadata')
             if metadata_elem is not None:
                 try:
-                    metadata = json.loads(metadata_elem.text)
+                    metadata = json_loads(metadata_elem.text)
                     print(f"[QR] Found metadata: {metadata['chunks']} chunks expected")
                     print(f"[QR] Original size: {metadata['total_size']:,} bytes")
                     print(f"[QR] Checksum: {metadata['checksum']}")
@@ -0,0 +1,122 @@
+"""
+Minimal ISO BMFF (MP4/MOV) box parser for reading video metadata without a decoder
+"""
+
+import os
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+
+def _iter_boxes(f: BinaryIO, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield (type, payload_start, box_end) for each box between start and end"""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+
+        size, box_type = struct.unpack('>I4s', header)
+        header_size = 8
+        if size == 1:  # 64-bit largesize follows the type
+            largesize = f.read(8)
+            if len(largesize) < 8:
+                return
+            size = struct.unpack('>Q', largesize)[0]
+            header_size = 16
+        elif size == 0:  # Box extends to the end of its parent
+            size = end - pos
+
+        if size < header_size or pos + size > end:
+            return
+
+        yield box_type, pos + header_size, pos + size
+        pos += size
+
+
+def _find_box(f: BinaryIO, start: int, end: int, box_type: bytes) -> Optional[Tuple[int, int]]:
+    """Return (payload_start, box_end) of the first child box of the given type"""
+    for child_type, payload_start, box_end in _iter_boxes(f, start, end):
+        if child_type == box_type:
+            return payload_start, box_end
+    return None
+
+
+def _read_at(f: BinaryIO, offset: int, size: int) -> bytes:
+    f.seek(offset)
+    return f.read(size)
+
+
+def _parse_video_track(f: BinaryIO, start: int, end: int) -> Optional[Dict[str, Any]]:
+    """Parse one trak box, returning its metadata if it is a video track"""
+    mdia = _find_box(f, start, end, b'mdia')
+    if mdia is None:
+        return None
+
+    # hdlr: version/flags(4) pre_defined(4) handler_type(4)
+    hdlr = _find_box(f, mdia[0], mdia[1], b'hdlr')
+    if hdlr is None or _read_at(f, hdlr[0] + 8, 4) != b'vide':
+        return None
+
+    # tkhd: width/height are 16.16 fixed point at offset 76 (v0) or 88 (v1)
+    tkhd = _find_box(f, start, end, b'tkhd')
+    if tkhd is None:
+        return None
+    version = _read_at(f, tkhd[0], 1)
+    dims_offset = 88 if version == b'\x01' else 76
+    width, height = struct.unpack('>II', _read_at(f, tkhd[0] + dims_offset, 8))
+
+    # mdhd: timescale/duration after creation and modification times
+    timescale = duration = 0
+    mdhd = _find_box(f, mdia[0], mdia[1], b'mdhd')
+    if mdhd is not None:
+        if _read_at(f, mdhd[0], 1) == b'\x01':
+            timescale, duration = struct.unpack('>IQ', _read_at(f, mdhd[0] + 20, 12))
+        else:
+            timescale, duration = struct.unpack('>II', _read_at(f, mdhd[0] + 12, 8))
+
+    # stsz: version/flags(4) sample_size(4) sample_count(4)
+    frame_count = 0
+    minf = _find_box(f, mdia[0], mdia[1], b'minf')
+    stbl = _find_box(f, minf[0], minf[1], b'stbl') if minf else None
+    stsz = _find_box(f, stbl[0], stbl[1], b'stsz') if stbl else None
+    if stsz is not None:
+        frame_count = struct.unpack('>I', _read_at(f, stsz[0] + 8, 4))[0]
+
+    seconds = duration / timescale if timescale else 0
+    return {
+        'width': width >> 16,
+        'height': height >> 16,
+        'fps': frame_count / seconds if seconds > 0 else 0,
+        'frame_count': frame_count,
+        'duration': seconds,
+    }
+
+
+def read_mp4_metadata(mp4_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read video metadata by walking the moov/trak box tree
+
+    Args:
+        mp4_path: Path to an MP4/MOV file
+
+    Returns:
+        Dict with width, height, fps, frame_count and duration of the first
+        video track, or None if the file is not a parseable MP4
+    """
+    try:
+        file_size = os.path.getsize(mp4_path)
+        with open(mp4_path, 'rb') as f:
+            moov = _find_box(f, 0, file_size, b'moov')
+            if moov is None:
+                return None
+
+            for box_type, payload_start, box_end in _iter_boxes(f, moov[0], moov[1]):
+                if box_type == b'trak':
+                    metadata = _parse_video_track(f, payload_start, box_end)
+                    if metadata and metadata['width'] and metadata['height']:
+                        return metadata
+    except (OSError, struct.error):
+        pass
+
+    return None
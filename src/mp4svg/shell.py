@@ -9,6 +9,7 @@ import sys
 import shlex
 import tempfile
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from . import (
@@ -18,6 +19,21 @@ from . import (
 from .validators import SVGValidator, IntegrityValidator
 
 
+def _convert_one(converter, mp4_file, svg_path):
+    """
+    Convert a single file in a batch worker process
+    
+    The converter is the shell's configured instance, pickled into the
+    worker so options set on it (e.g. chunk_size) carry over.
+    """
+    filename = os.path.basename(mp4_file)
+    try:
+        result = converter.convert(mp4_file, svg_path)
+        return filename, bool(result), None
+    except Exception as e:
+        return filename, False, str(e)
+
+
 class MP4SVGShell(cmd.Cmd):
     """Interactive shell for mp4svg operations"""
     
@@ -453,25 +469,32 @@ class MP4SVGShell(cmd.Cmd):
             
             print(f"🔄 Batch converting {len(mp4_files)} MP4 files using {method} method...")
             
-            converter = self.converters[method]
+            if method not in self.converters:
+                print(f"❌ Unknown method: {method}")
+                return
+            
+            svg_paths = [
+                os.path.join(output_dir, os.path.basename(mp4_file).replace('.mp4', '.svg'))
+                for mp4_file in mp4_files
+            ]
+            
+            # Files are independent, so convert them on separate cores
+            workers = min(len(mp4_files), os.cpu_count() or 1)
             success_count = 0
             
-            for i, mp4_file in enumerate(mp4_files, 1):
-                filename = os.path.basename(mp4_file)
-                svg_filename = filename.replace('.mp4', '.svg')
-                svg_path = os.path.join(output_dir, svg_filename)
-                
-                print(f"[{i}/{len(mp4_files)}] Converting {filename}...")
-                
-                try:
-                    result = converter.convert(mp4_file, svg_path)
-                    if result:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                converter = self.converters[method]
+                results = executor.map(_convert_one, [converter] * len(mp4_files), mp4_files, svg_paths)
+                for i, (filename, success, error) in enumerate(results, 1):
+                    # Results arrive once each file has finished converting
+                    progress = f"[{i}/{len(mp4_files)}]"
+                    if error:
+                        print(f"{progress} ❌ Error: {filename} - {error}")
+                    elif success:
                         success_count += 1
-                        print(f"   ✅ Success: {svg_filename}")
+                        print(f"{progress} ✅ {filename} → {os.path.basename(svg_paths[i - 1])}")
                     else:
-                        print(f"   ❌ Failed: {filename}")
-                except Exception as e:
-                    print(f"   ❌ Error: {filename} - {e}")
+                        print(f"{progress} ❌ Failed: {filename}")
             
             print(f"\n📊 Batch conversion complete: {success_count}/{len(mp4_files)} successful")
             
@@ -3,13 +3,14 @@ Data integrity validation for mp4svg files
 """
 
 import os
+import hmac
+import mmap
 import hashlib
-import json
 import base64
 from typing import Dict, Optional, Tuple
 from ..converters.ascii85_converter import ASCII85SVGConverter
 from ..converters.polyglot_converter import PolyglotSVGConverter
-from ..base import ValidationError
+from ..base import ValidationError, json_loads
 
 
 class IntegrityValidator:
@@ -64,17 +65,18 @@ class IntegrityValidator:
             if extracted_data:
                 result['extraction_successful'] = True
                 result['extracted_size'] = len(extracted_data)
-                result['extracted_checksum'] = hashlib.sha256(extracted_data).hexdigest()
+                extracted_digest = hashlib.sha256(extracted_data).digest()
+                result['extracted_checksum'] = extracted_digest.hex()
                 
                 # Compare with original if provided
                 if original_mp4_path and os.path.exists(original_mp4_path):
-                    original_data = self._read_original_mp4(original_mp4_path)
-                    result['original_size'] = len(original_data)
-                    result['original_checksum'] = hashlib.sha256(original_data).hexdigest()
+                    original_digest = self._file_digest(original_mp4_path)
+                    result['original_size'] = os.stat(original_mp4_path).st_size
+                    result['original_checksum'] = original_digest.hex()
                     
                     # Check integrity
                     result['size_match'] = result['extracted_size'] == result['original_size']
-                    result['checksum_match'] = result['extracted_checksum'] == result['original_checksum']
+                    result['checksum_match'] = hmac.compare_digest(extracted_digest, original_digest)
                     result['data_integrity_valid'] = result['size_match'] and result['checksum_match']
                     
                     if not result['size_match']:
@@ -129,17 +131,19 @@ class IntegrityValidator:
     def _detect_format(self, svg_path: str) -> Optional[str]:
         """Detect mp4svg format type"""
         
-        with open(svg_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if os.path.getsize(svg_path) == 0:
+            return None
         
-        if 'POLYGLOT_BOUNDARY_' in content:
-            return 'polyglot'
-        elif 'encoding="ascii85"' in content:
-            return 'ascii85'
-        elif 'qr-frame-' in content:
-            return 'qrcode'
-        elif '<path d=' in content and '<set attributeName=' in content:
-            return 'vector'
+        # Search the mapped bytes directly instead of decoding the file to str
+        with open(svg_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            if content.find(b'POLYGLOT_BOUNDARY_') != -1:
+                return 'polyglot'
+            elif content.find(b'encoding="ascii85"') != -1:
+                return 'ascii85'
+            elif content.find(b'qr-frame-') != -1:
+                return 'qrcode'
+            elif content.find(b'<path d=') != -1 and content.find(b'<set attributeName=') != -1:
+                return 'vector'
         
         return None
 
@@ -168,10 +172,16 @@ class IntegrityValidator:
         
         return None
 
-    def _read_original_mp4(self, mp4_path: str) -> bytes:
-        """Read original MP4 file"""
-        with open(mp4_path, 'rb') as f:
-            return f.read()
+    def _file_digest(self, path: str) -> bytes:
+        """Stream a file through SHA-256 without loading it into memory"""
+        with open(path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'sha256').digest()
+            
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+            return digest.digest()
 
     def _validate_qr_checksums(self, svg_path: str) -> Dict:
         """Validate checksums in QR code format"""
@@ -192,7 +202,7 @@ class IntegrityValidator:
             metadata_elem = root.find('metadata')
             if metadata_elem is not None:
                 try:
-                    metadata = json.loads(metadata_elem.text)
+                    metadata = json_loads(metadata_elem.text)
                     if 'checksum' in metadata:
                         result['has_embedded_checksums'] = True
                         result['checksum_details']['overall_checksum'] = metadata['checksum']
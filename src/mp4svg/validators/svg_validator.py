@@ -6,7 +6,7 @@ import os
 import xml.etree.ElementTree as ET
 from lxml import etree
 from typing import Dict, List, Optional, Tuple
-from ..base import ValidationError
+from ..base import ValidationError, json_loads
 
 
 class SVGValidator:
@@ -174,8 +174,7 @@ class SVGValidator:
             metadata_elem = root.find('metadata')
             if metadata_elem is not None:
                 try:
-                    import json
-                    qr_metadata = json.loads(metadata_elem.text)
+                    qr_metadata = json_loads(metadata_elem.text)
                     metadata.update(qr_metadata)
                 except:
                     pass
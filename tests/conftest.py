@@ -0,0 +1,37 @@
+"""
+Shared pytest configuration for mp4svg tests
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+
+def _tmp_root_parent():
+    """Prefer a RAM-backed filesystem for scratch files when available"""
+    if sys.platform == 'linux' and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
+
+
+def pytest_configure(config):
+    """
+    Route every tempfile.mkdtemp() in the suite into one session directory
+
+    Test classes still remove their own scratch dirs in teardown_method, so
+    a RAM-backed root only ever holds one test's files; the session tree is
+    dropped in pytest_unconfigure as a backstop.
+    """
+    config._mp4svg_original_tempdir = tempfile.tempdir
+    config._mp4svg_tmp_root = tempfile.mkdtemp(prefix='mp4svg_tests_', dir=_tmp_root_parent())
+    tempfile.tempdir = config._mp4svg_tmp_root
+
+
+def pytest_unconfigure(config):
+    """Restore the tempfile default and drop the session directory"""
+    tmp_root = getattr(config, '_mp4svg_tmp_root', None)
+    if tmp_root is None:
+        return
+    tempfile.tempdir = config._mp4svg_original_tempdir
+    shutil.rmtree(tmp_root, ignore_errors=True)
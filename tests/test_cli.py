@@ -0,0 +1,136 @@
+"""
+Tests for the mp4svg command-line interface
+"""
+
+import os
+import gzip
+import tempfile
+import pytest
+from unittest.mock import patch
+
+from mp4svg.cli import main
+from mp4svg.converters import Base64SVGConverter
+
+from .test_mp4box import _box, _video_trak
+
+
+def _write_mp4(path: str) -> str:
+    """Write a small MP4 whose box tree parses, so no decoder is needed"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(
+            _box(b'ftyp', b'isom' + bytes(4))
+            + _box(b'mdat', b'cli test video data' * 4)
+            + _box(b'moov', _video_trak(320, 240, 12800, 25600, 60))
+        )
+    return path
+
+
+def _run_cli(*argv):
+    with patch('sys.argv', ['mp4svg', *argv]):
+        main()
+
+
+class TestCLI:
+    """Test command-line conversion"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_single_input(self):
+        """Test converting one video to the given output file"""
+        test_mp4 = _write_mp4(os.path.join(self.temp_dir, 'video.mp4'))
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+
+        _run_cli(test_mp4, output_svg, '--method', 'ascii85')
+
+        with open(output_svg, 'r') as f:
+            assert 'encoding="ascii85"' in f.read()
+
+    def test_multiple_inputs_to_directory(self):
+        """Test several inputs write one SVG each into the output directory"""
+        inputs = [_write_mp4(os.path.join(self.temp_dir, name)) for name in ('a.mp4', 'b.mp4')]
+        output_dir = os.path.join(self.temp_dir, 'out')
+
+        _run_cli(*inputs, output_dir, '--method', 'ascii85')
+
+        assert sorted(os.listdir(output_dir)) == ['a.svg', 'b.svg']
+
+    def test_multiple_inputs_parallel_jobs(self):
+        """Test --jobs converts several inputs in worker processes"""
+        inputs = [_write_mp4(os.path.join(self.temp_dir, name)) for name in ('a.mp4', 'b.mp4', 'c.mp4')]
+        output_dir = os.path.join(self.temp_dir, 'out')
+
+        _run_cli(*inputs, output_dir, '--method', 'polyglot', '--jobs', '2')
+
+        assert sorted(os.listdir(output_dir)) == ['a.svg', 'b.svg', 'c.svg']
+
+    def test_colliding_basenames_rejected(self, capsys):
+        """Test inputs that would write the same output are refused up front"""
+        first = _write_mp4(os.path.join(self.temp_dir, 'a', 'x.mp4'))
+        second = _write_mp4(os.path.join(self.temp_dir, 'b', 'x.mp4'))
+        output_dir = os.path.join(self.temp_dir, 'out')
+
+        with pytest.raises(SystemExit) as exc_info:
+            _run_cli(first, second, output_dir, '--method', 'ascii85')
+
+        assert exc_info.value.code == 1
+        assert first in capsys.readouterr().out
+        assert not os.path.exists(output_dir)
+
+    def test_svgz_output_naming(self):
+        """Test --svgz swaps the extension and writes gzip data"""
+        test_mp4 = _write_mp4(os.path.join(self.temp_dir, 'video.mp4'))
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+
+        _run_cli(test_mp4, output_svg, '--method', 'base64', '--svgz')
+
+        output_svgz = os.path.join(self.temp_dir, 'output.svgz')
+        assert not os.path.exists(output_svg)
+        with gzip.open(output_svgz, 'rt', encoding='utf-8') as f:
+            assert f.read().startswith('<?xml')
+
+    def test_svgz_batch_naming(self):
+        """Test --svgz names every batch output '.svgz'"""
+        inputs = [_write_mp4(os.path.join(self.temp_dir, name)) for name in ('a.mp4', 'b.mp4')]
+        output_dir = os.path.join(self.temp_dir, 'out')
+
+        _run_cli(*inputs, output_dir, '--method', 'ascii85', '--svgz')
+
+        assert sorted(os.listdir(output_dir)) == ['a.svgz', 'b.svgz']
+
+    def test_svgz_unsupported_method(self):
+        """Test --svgz is refused for methods that cannot compress their output"""
+        test_mp4 = _write_mp4(os.path.join(self.temp_dir, 'video.mp4'))
+
+        with pytest.raises(SystemExit) as exc_info:
+            _run_cli(test_mp4, os.path.join(self.temp_dir, 'output.svg'), '--method', 'vector', '--svgz')
+
+        assert exc_info.value.code == 1
+
+    def test_oversized_base64_exits_with_error(self, capsys):
+        """Test an EncodingError from the size limit exits 1 without output"""
+        test_mp4 = _write_mp4(os.path.join(self.temp_dir, 'video.mp4'))
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+
+        with patch.object(Base64SVGConverter, 'MAX_ENCODED_SIZE', 8):
+            with pytest.raises(SystemExit) as exc_info:
+                _run_cli(test_mp4, output_svg, '--method', 'base64')
+
+        assert exc_info.value.code == 1
+        assert 'Error:' in capsys.readouterr().out
+        assert not os.path.exists(output_svg)
+
+    def test_force_overrides_base64_size_limit(self):
+        """Test --force is passed through to the base64 converter"""
+        test_mp4 = _write_mp4(os.path.join(self.temp_dir, 'video.mp4'))
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+
+        with patch.object(Base64SVGConverter, 'MAX_ENCODED_SIZE', 8):
+            _run_cli(test_mp4, output_svg, '--method', 'base64', '--force')
+
+        assert os.path.exists(output_svg)
@@ -13,6 +13,9 @@ from mp4svg import (
     SVGVectorFrameConverter, QRCodeSVGConverter,
     HybridSVGConverter, EncodingError, DecodingError
 )
+from mp4svg.converters import Base64SVGConverter
+
+from .test_mp4box import _box, _video_trak
 
 
 class TestASCII85Converter:
@@ -58,6 +61,15 @@ class TestASCII85Converter:
         
         assert decoded == b""
 
+    def test_ascii85_zero_groups(self):
+        """Test 'z' shorthand for full zero groups and zero-padded tails"""
+        test_data = b"\x00" * 8 + b"data" + b"\x00\x00"
+        encoded = self.converter._encode_ascii85(test_data)
+
+        assert encoded.startswith('<~14:zz')
+        assert not encoded[:-2].endswith('z')  # Partial tail group is never 'z'
+        assert self.converter._decode_ascii85(encoded) == test_data
+
     @patch('cv2.VideoCapture')
     def test_convert_success(self, mock_cv2):
         """Test successful ASCII85 conversion"""
@@ -93,6 +105,30 @@ class TestASCII85Converter:
         assert 'encoding="ascii85"' in content
         assert '<![CDATA[' in content
 
+    def test_convert_undecodable_video_uses_box_metadata(self):
+        """Test a parseable MP4 the decoder cannot open keeps its real dimensions"""
+        # Valid moov/trak box tree around a payload that is not a real stream,
+        # large enough that the converter tries to decode a preview frame
+        mp4_data = (
+            _box(b'ftyp', b'isom' + bytes(4))
+            + _box(b'mdat', bytes(self.converter.MIN_VIDEO_SIZE_FOR_THUMBNAIL))
+            + _box(b'moov', _video_trak(640, 480, 12800, 25600, 60))
+        )
+        test_mp4 = os.path.join(self.temp_dir, 'undecodable.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(mp4_data)
+
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+        self.converter.convert(test_mp4, output_svg)
+
+        with open(output_svg, 'r') as f:
+            content = f.read()
+
+        assert 'width="640" height="480"' in content
+        assert 'fps="30.0"' in content
+        assert 'frames="60"' in content
+        assert '"-1' not in content
+
     def test_convert_invalid_input(self):
         """Test conversion with invalid input"""
         with pytest.raises(FileNotFoundError):
@@ -157,6 +193,31 @@ class TestPolyglotConverter:
         assert '<!--MP4_DATA' in content
         assert 'MP4_DATA-->' in content
 
+    @patch('cv2.VideoCapture')
+    def test_convert_streamed_chunks(self, mock_cv2):
+        """Test chunked payload streaming matches whole-file encoding"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 0
+        mock_cv2.return_value = mock_cap
+
+        self.converter.STREAM_CHUNK_SIZE = 60 * 2  # Two lines per chunk
+        test_data = bytes(range(256)) * 2
+        test_mp4 = os.path.join(self.temp_dir, 'test.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(test_data)
+
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+        self.converter.convert(test_mp4, output_svg)
+
+        with open(output_svg, 'r') as f:
+            content = f.read()
+        assert self.converter._encode_for_svg_comment(test_data) in content
+
+        extracted_mp4 = os.path.join(self.temp_dir, 'extracted.mp4')
+        assert self.converter.extract(output_svg, extracted_mp4) is True
+        with open(extracted_mp4, 'rb') as f:
+            assert f.read() == test_data
+
 
 class TestVectorConverter:
     """Test Vector converter functionality"""
@@ -254,6 +315,45 @@ class TestQRCodeConverter:
         assert result == output_svg
         assert os.path.exists(output_svg)
 
+    @patch('cv2.VideoCapture')
+    def test_video_metadata_cached(self, mock_cv2):
+        """Test metadata is probed once per unchanged file"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 10
+        mock_cv2.return_value = mock_cap
+
+        test_mp4 = os.path.join(self.temp_dir, 'cached.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(b"not an mp4 box tree")
+
+        first = self.converter._get_video_metadata(test_mp4)
+        first['width'] = 0  # Callers get their own copy
+        second = self.converter._get_video_metadata(test_mp4)
+
+        assert mock_cv2.call_count == 1
+        assert second['width'] == 10
+
+    @patch('cv2.VideoCapture')
+    def test_video_metadata_disk_cache(self, mock_cv2):
+        """Test opt-in probe cache survives a cleared in-process cache"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 10
+        mock_cv2.return_value = mock_cap
+
+        test_mp4 = os.path.join(self.temp_dir, 'cached.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(b"not an mp4 box tree")
+
+        cache_dir = os.path.join(self.temp_dir, 'probe_cache')
+        with patch.dict(os.environ, {'MP4SVG_PROBE_CACHE': cache_dir}):
+            first = self.converter._get_video_metadata(test_mp4)
+            self.converter._cached_video_metadata.cache_clear()
+            second = self.converter._get_video_metadata(test_mp4)
+
+        assert mock_cv2.call_count == 1
+        assert second == first
+        assert len(os.listdir(cache_dir)) == 1
+
     def test_generate_extraction_script(self):
         """Test extraction script generation"""
         script = self.converter._generate_extraction_script('test.svg', 'output.mp4')
@@ -264,6 +364,136 @@ class TestQRCodeConverter:
         assert 'output.mp4' in script
 
 
+class TestBase64Converter:
+    """Test Base64 converter functionality"""
+
+    def setup_method(self):
+        self.converter = Base64SVGConverter()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @patch('cv2.VideoCapture')
+    def test_convert_extract_roundtrip(self, mock_cv2):
+        """Test streamed Base64 conversion across several chunks"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 0
+        mock_cap.read.return_value = (True, np.zeros((120, 160, 3), dtype=np.uint8))
+        mock_cv2.return_value = mock_cap
+
+        self.converter.STREAM_CHUNK_SIZE = 3 * 4  # Force many small chunks
+        test_data = bytes(range(256)) * 3 + b"tail"
+        test_mp4 = os.path.join(self.temp_dir, 'test.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(test_data)
+
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+        self.converter.convert(test_mp4, output_svg, width=160, height=120)
+
+        extracted_mp4 = os.path.join(self.temp_dir, 'extracted.mp4')
+        assert self.converter.extract(output_svg, extracted_mp4) is True
+
+        with open(extracted_mp4, 'rb') as f:
+            assert f.read() == test_data
+
+    @patch('cv2.VideoCapture')
+    def test_small_video_skips_thumbnail(self, mock_cv2):
+        """Test tiny videos are embedded without decoding a preview frame"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 0
+        mock_cv2.return_value = mock_cap
+
+        test_mp4 = os.path.join(self.temp_dir, 'tiny.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(b"tiny clip")
+
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+        self.converter.convert(test_mp4, output_svg, width=160, height=120)
+
+        with open(output_svg, 'r') as f:
+            content = f.read()
+
+        mock_cap.read.assert_not_called()
+        assert '<image' not in content
+
+    @patch('cv2.VideoCapture')
+    def test_oversized_payload_rejected(self, mock_cv2):
+        """Test payloads above MAX_ENCODED_SIZE fail early unless forced"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 0
+        mock_cv2.return_value = mock_cap
+
+        self.converter.MAX_ENCODED_SIZE = 8
+        test_mp4 = os.path.join(self.temp_dir, 'test.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(b"more than six bytes")
+
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+        with pytest.raises(EncodingError):
+            self.converter.convert(test_mp4, output_svg, width=160, height=120)
+        assert not os.path.exists(output_svg)
+        mock_cv2.assert_not_called()
+
+        self.converter.convert(test_mp4, output_svg, width=160, height=120, force=True)
+        assert os.path.exists(output_svg)
+
+    @patch('cv2.VideoCapture')
+    def test_failed_encode_removes_output(self, mock_cv2):
+        """Test a mid-stream encoding failure leaves no preallocated SVG behind"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 0
+        mock_cv2.return_value = mock_cap
+
+        test_mp4 = os.path.join(self.temp_dir, 'test.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(b"partial video data" * 100)
+
+        output_svg = os.path.join(self.temp_dir, 'output.svg')
+        with patch('mp4svg.converters.base64_converter.fast_b64encode', side_effect=RuntimeError("boom")):
+            with pytest.raises(Exception):
+                self.converter.convert(test_mp4, output_svg, width=160, height=120)
+        assert not os.path.exists(output_svg)
+
+    def test_open_output_failure_keeps_existing_file(self):
+        """Test an output that cannot be opened is left as it was"""
+        output_svg = os.path.join(self.temp_dir, 'existing.svg')
+        with open(output_svg, 'wb') as f:
+            f.write(b"existing svg")
+
+        with patch('mp4svg.base.open', side_effect=PermissionError("denied"), create=True):
+            with pytest.raises(PermissionError):
+                with self.converter._open_output(output_svg):
+                    pass
+
+        with open(output_svg, 'rb') as f:
+            assert f.read() == b"existing svg"
+
+    @patch('cv2.VideoCapture')
+    def test_convert_extract_svgz(self, mock_cv2):
+        """Test gzip-compressed output for .svgz paths"""
+        mock_cap = Mock()
+        mock_cap.get.return_value = 0
+        mock_cv2.return_value = mock_cap
+
+        test_data = b"svgz video data" * 10
+        test_mp4 = os.path.join(self.temp_dir, 'test.mp4')
+        with open(test_mp4, 'wb') as f:
+            f.write(test_data)
+
+        output_svgz = os.path.join(self.temp_dir, 'output.svgz')
+        self.converter.convert(test_mp4, output_svgz, width=160, height=120)
+
+        with open(output_svgz, 'rb') as f:
+            assert f.read(2) == b'\x1f\x8b'  # gzip magic
+
+        extracted_mp4 = os.path.join(self.temp_dir, 'extracted.mp4')
+        assert self.converter.extract(output_svgz, extracted_mp4) is True
+        with open(extracted_mp4, 'rb') as f:
+            assert f.read() == test_data
+
+
 class TestHybridConverter:
     """Test Hybrid converter functionality"""
 
@@ -0,0 +1,63 @@
+"""
+Tests for the MP4 box metadata parser
+"""
+
+import os
+import struct
+import tempfile
+
+from mp4svg.mp4box import read_mp4_metadata
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack('>I4s', 8 + len(payload), box_type) + payload
+
+
+def _video_trak(width: int, height: int, timescale: int, duration: int, frames: int) -> bytes:
+    tkhd = bytes(76) + struct.pack('>II', width << 16, height << 16)
+    mdhd = bytes(12) + struct.pack('>II', timescale, duration) + bytes(4)
+    hdlr = bytes(8) + b'vide' + bytes(12)
+    stsz = bytes(8) + struct.pack('>I', frames)
+    minf = _box(b'minf', _box(b'stbl', _box(b'stsz', stsz)))
+    mdia = _box(b'mdia', _box(b'mdhd', mdhd) + _box(b'hdlr', hdlr) + minf)
+    return _box(b'trak', _box(b'tkhd', tkhd) + mdia)
+
+
+class TestMP4BoxParser:
+    """Test MP4 box metadata parsing"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_read_video_track_metadata(self):
+        """Test reading dimensions, fps and frame count from moov/trak"""
+        audio_trak = _box(b'trak', _box(b'mdia', _box(b'hdlr', bytes(8) + b'soun' + bytes(12))))
+        mp4_data = (
+            _box(b'ftyp', b'isom' + bytes(4))
+            + _box(b'mdat', b'\x00' * 64)
+            + _box(b'moov', audio_trak + _video_trak(640, 480, 12800, 25600, 60))
+        )
+
+        mp4_path = os.path.join(self.temp_dir, 'test.mp4')
+        with open(mp4_path, 'wb') as f:
+            f.write(mp4_data)
+
+        metadata = read_mp4_metadata(mp4_path)
+
+        assert metadata['width'] == 640
+        assert metadata['height'] == 480
+        assert metadata['frame_count'] == 60
+        assert metadata['duration'] == 2.0
+        assert metadata['fps'] == 30.0
+
+    def test_read_non_mp4_returns_none(self):
+        """Test that non-MP4 data falls through to None"""
+        mp4_path = os.path.join(self.temp_dir, 'fake.mp4')
+        with open(mp4_path, 'wb') as f:
+            f.write(b"fake mp4 data for testing")
+
+        assert read_mp4_metadata(mp4_path) is None
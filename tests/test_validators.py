@@ -39,6 +39,24 @@ class TestSVGValidator:
         assert result['is_valid'] is True
         assert len(result['errors']) == 0
 
+    def test_validate_well_formed_svg_with_leading_comment(self):
+        """Test that a top-level comment before the root is still well-formed"""
+        svg_content = '''<?xml version="1.0" encoding="UTF-8"?>
+<!-- Generator: test suite -->
+<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">
+    <rect width="50" height="50" fill="red"/>
+</svg>'''
+        
+        svg_file = os.path.join(self.temp_dir, 'test.svg')
+        with open(svg_file, 'w') as f:
+            f.write(svg_content)
+        
+        result = self.validator.validate_svg_file(svg_file)
+        
+        assert result['is_well_formed'] is True
+        assert result['is_valid'] is True
+        assert len(result['errors']) == 0
+
     def test_validate_malformed_xml(self):
         """Test validation of malformed XML"""
         svg_content = '''<?xml version="1.0" encoding="UTF-8"?>